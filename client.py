@@ -27,6 +27,7 @@ def main() -> None:
 
     try:
         screen = Screen()
+        screen.add_reader(server, server.on_readable)
         Rectangle(screen, Point(0, 0), Point(1, 1))
         screen.listen_keys()
     finally:
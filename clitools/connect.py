@@ -9,10 +9,26 @@ __all__ = [
 ]
 
 from abc import ABC, abstractmethod
-from socket import socket, AF_INET, SOCK_STREAM
-from threading import Thread
+from selectors import DefaultSelector, EVENT_READ
+from socket import (
+    socket,
+    AF_INET,
+    SOCK_STREAM,
+    SOL_SOCKET,
+    SO_REUSEADDR,
+    SO_RCVBUF,
+    IPPROTO_TCP,
+    TCP_NODELAY,
+)
 
 BUF_SIZE = 1024
+# size of the kernel receive buffer of sockets
+RCVBUF_SIZE = 1 << 20
+# delimiter terminating each message on the wire; messages must not contain
+# it and are delivered to handlers exactly as sent
+MSG_DELIM = b"\n"
+# maximum length of a message without its delimiter (in bytes)
+MAX_MSG_SIZE = 1 << 16
 
 
 def read_port(arg: str) -> int:
@@ -25,6 +41,17 @@ def read_port(arg: str) -> int:
     return port
 
 
+def _noop(msg: str) -> None:
+    """Discard a message."""
+
+
+def _frame(msg: str) -> bytes:
+    """Encode a message and terminate it with the delimiter."""
+    if "\n" in msg:
+        raise ValueError("message without line feeds expected")
+    return msg.encode() + MSG_DELIM
+
+
 class Logger(ABC):
     """Logger."""
 
@@ -57,37 +84,58 @@ class Server:
         conn = socket(AF_INET, SOCK_STREAM)
         self._conn = conn
         self._addr = addr
-        self._clients: "set[ClientConnection]" = set()
-        self._logger: Logger = StdoutLogger("[SERVER] ")
+        self._clients: "list[ClientConnection]" = []
+        self._clients_snapshot: "tuple[ClientConnection, ...]" = ()
+        self._selector = DefaultSelector()
+        self._log = StdoutLogger("[SERVER] ").log
+        conn.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        conn.setsockopt(SOL_SOCKET, SO_RCVBUF, RCVBUF_SIZE)
         conn.bind(addr)
         conn.listen()
-        self._logger.log(f"listening on {addr[0]}:{addr[1]}")
+        self._selector.register(conn, EVENT_READ, self._accept_client)
+        self._log(f"listening on {addr[0]}:{addr[1]}")
+
+    def _accept_client(self) -> None:
+        """Accept a client connection."""
+        conn, addr = self._conn.accept()
+        conn.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        client = ClientConnection(conn, addr, self)
+        self._clients.append(client)
+        self._clients_snapshot = tuple(self._clients)
+        self._selector.register(client, EVENT_READ, client.on_readable)
 
     def accept(self) -> None:
-        """Accept client connections."""
-        conn = self._conn
+        """Accept client connections and recieve their messages."""
+        select = self._selector.select
         while True:
-            self._clients.add(ClientConnection(*conn.accept(), self))
+            for key, _ in select():
+                key.data()
 
     def remove(self, client: "ClientConnection") -> None:
         """Remove a client."""
-        self._clients.discard(client)
+        if client in self._clients:
+            self._clients.remove(client)
+            self._clients_snapshot = tuple(self._clients)
+            self._selector.unregister(client)
 
     def bcast(self, msg: str) -> None:
         """Broadcast a message to all clients."""
-        disconn: "set[ClientConnection]" = set()
-        for client in self._clients:
+        buf = _frame(msg)
+        disconn: "list[ClientConnection]" = []
+        for client in self._clients_snapshot:
             try:
-                client.send(msg)
+                client.send_bytes(buf)
             except ConnectionResetError:
-                disconn.add(client)
+                disconn.append(client)
         for client in disconn:
-            self.remove(client)
+            client.close()
+        self._log("broadcast message: " + msg)
 
     def close(self) -> None:
         """Close server connection."""
+        self._selector.close()
         self._conn.close()
-        self._logger.log("shutting down")
+        self._log("shutting down")
 
 
 class MessageHandler(ABC):
@@ -101,51 +149,101 @@ class MessageHandler(ABC):
 class Connection:
     """Connection."""
 
-    def __init__(self, conn: socket, logger: Logger = NullLogger()) -> None:
+    def __init__(self, conn: socket, logger: "Logger|None" = None) -> None:
         self._conn = conn
-        self._logger = logger
-        self._handlers: "set[MessageHandler]" = set()
-        thread = Thread(target=self.recv, daemon=True)
-        thread.start()
+        self._log = (
+            _noop
+            if logger is None or isinstance(logger, NullLogger)
+            else logger.log
+        )
+        self._handlers: "list[MessageHandler]" = []
+        self._handlers_snapshot: "tuple[MessageHandler, ...]" = ()
+        self._inbuf = bytearray()
+        self._log("connected")
+
+    def fileno(self) -> int:
+        """Get the file descriptor of the socket."""
+        return self._conn.fileno()
 
     def add_handler(self, handler: MessageHandler) -> None:
         """Add a handler for recieved messages."""
-        self._handlers.add(handler)
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+            self._handlers_snapshot = tuple(self._handlers)
 
     def remove_handler(self, handler: MessageHandler) -> None:
         """Remove a handler for recieved messages."""
-        self._handlers.discard(handler)
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+            self._handlers_snapshot = tuple(self._handlers)
 
     def send(self, msg: str) -> None:
         """Send a message."""
-        logger = self._logger
+        if self.send_bytes(_frame(msg)):
+            self._log("sent message: " + msg)
+
+    def send_bytes(self, buf: bytes) -> bool:
+        """Send an encoded and delimited message and report success."""
         try:
-            self._conn.sendall(msg.encode())  # BrokenPipeError
-            logger.log("sent message: " + msg)
+            self._conn.sendall(buf)  # BrokenPipeError
+            return True
         except BrokenPipeError:
-            logger.log("broken pipe")
+            self._log("broken pipe")
             self.close()
+            return False
 
-    def recv(self) -> None:
-        """Recieve messages."""
+    def on_readable(self) -> bool:
+        """Recieve available data and report if the connection is open."""
         conn = self._conn
-        handlers = self._handlers
-        logger = self._logger
-        logger.log("connected")
+        if conn.fileno() < 0:
+            return False
+        log = self._log
+        try:
+            data = conn.recv(BUF_SIZE)  # ConnectionResetError
+        except ConnectionResetError:
+            log("connection reset")
+            data = b""
+        except OSError as err:
+            log(f"connection error: {err}")
+            data = b""
+        if not data:
+            log("disconnected")
+            self.close()
+            return False
+        inbuf = self._inbuf
+        inbuf += data
+        handlers = self._handlers_snapshot
+        start = 0
+        end = inbuf.find(MSG_DELIM)
         try:
-            while True:
-                data = conn.recv(BUF_SIZE)  # ConnectionResetError
-                if not data:
-                    break
-                msg = data.decode().strip()
-                logger.log("recieved message: " + msg)
+            while end >= 0:
+                frame = inbuf[start:end]
+                start = end + 1
+                end = inbuf.find(MSG_DELIM, start)
+                try:
+                    msg = frame.decode()
+                except UnicodeDecodeError:
+                    log("dropped undecodable message")
+                    continue
+                log("recieved message: " + msg)
                 for handler in handlers:
                     handler.handle(msg)
-        except ConnectionResetError:
-            logger.log("connection reset")
+        except Exception as err:
+            log(f"handler failed: {err!r}")
+            self.close()
+            return False
         finally:
-            logger.log("disconnected")
+            del inbuf[:start]
+        if len(inbuf) > MAX_MSG_SIZE:
+            log("message too long")
             self.close()
+            return False
+        return conn.fileno() >= 0
+
+    def recv(self) -> None:
+        """Recieve messages until the connection is closed."""
+        while self.on_readable():
+            pass
 
     def close(self) -> None:
         """Close the connection."""
@@ -163,8 +261,8 @@ class ClientConnection(Connection):
         super().__init__(conn, StdoutLogger(f"[CLIENT({addr[0]}:{addr[1]})] "))
 
     def close(self) -> None:
-        super().close()
         self._server.remove(self)
+        super().close()
 
 
 class ServerConnection(Connection):
@@ -173,5 +271,7 @@ class ServerConnection(Connection):
     def __init__(self, addr: "tuple[str, int]") -> None:
         self._addr = addr
         conn = socket(AF_INET, SOCK_STREAM)
+        conn.setsockopt(SOL_SOCKET, SO_RCVBUF, RCVBUF_SIZE)
         conn.connect(addr)  # ConnectionRefusedError
+        conn.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
         super().__init__(conn)
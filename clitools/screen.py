@@ -3,13 +3,50 @@
 __all__ = ["Screen", "Point", "Displayable", "Text", "Button", "Rectangle"]
 
 from abc import ABC, abstractmethod
-from sys import platform, stdin
+from array import array
+from selectors import DefaultSelector, EVENT_READ
+from sys import platform, stdin, stdout, version_info
 from shutil import get_terminal_size
 from signal import signal, SIGWINCH
+from time import sleep
 from types import FrameType
+from typing import Any, Callable
+
+# typecode of an array of Unicode characters
+CHAR_TYPECODE = "w" if version_info >= (3, 13) else "u"
+# maximum number of bytes read from the standard input at once
+KEY_BUF_SIZE = 64
+# waiting time for further input per key of an input burst (in seconds)
+POLL_WAIT_STEP = 0.002
+# maximum waiting time for further input before a redraw (in seconds)
+MAX_POLL_WAIT = 0.01
+# smoothing factor of the moving average of the number of keys per burst
+BURST_SMOOTHING = 0.25
+# minimum number of buttons for which focus navigation uses NumPy
+MIN_VECTORIZED_BUTTONS = 20
+# interval for polling the console if it cannot be selected (in seconds)
+KEY_POLL_INTERVAL = 0.01
+
+# bytes read from the standard input but not yet consumed
+_pending = bytearray()
+# NumPy module once imported, or False if it is unavailable
+_numpy = None
+
+
+def _import_numpy():
+    """Import NumPy on first use and return it or None if unavailable."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy or None
 
 if platform == "win32":
-    from msvcrt import getch  # type: ignore
+    from msvcrt import getch, kbhit  # type: ignore
 
     def get_stdin_attrs() -> list:
         """Get the TTY attributes of the stdandard input."""
@@ -23,14 +60,36 @@ if platform == "win32":
         """Set the mode of the stdandard input to raw."""
         pass
 
+    def _read_byte() -> bytes:
+        """Read a byte from the buffered standard input."""
+        pending = _pending
+        if not pending:
+            pending += getch()
+            while kbhit() and len(pending) < KEY_BUF_SIZE:
+                pending += getch()
+        byte = bytes(pending[:1])
+        del pending[:1]
+        return byte
+
     def get_key() -> str:
         """Read a keypress."""
-        key = getch()
+        key = _read_byte()
         if key in {b"\x00", b"\xe0"}:
-            key += getch()
+            key += _read_byte()
         return key.decode(errors="ignore")
 
+    def key_ready(timeout: float = 0.0) -> bool:
+        """Check whether a keypress is available within a timeout."""
+        if _pending or kbhit():
+            return True
+        if timeout > 0.0:
+            sleep(timeout)
+            return bool(kbhit())
+        return False
+
 else:
+    from os import read
+    from select import select
     from tty import setraw
     from termios import tcgetattr, tcsetattr, TCSADRAIN
 
@@ -46,17 +105,39 @@ else:
         """Set the mode of the stdandard input to raw."""
         setraw(stdin)
 
+    def _read_char() -> str:
+        """Read a character from the buffered standard input."""
+        pending = _pending
+        if not pending:
+            pending += read(stdin.fileno(), KEY_BUF_SIZE)
+            if not pending:
+                return ""
+        lead = pending[0]
+        size = (
+            1
+            if lead < 0xC0
+            else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        )
+        while len(pending) < size:
+            data = read(stdin.fileno(), KEY_BUF_SIZE)
+            if not data:
+                break
+            pending += data
+        char = pending[:size].decode(errors="ignore")
+        del pending[:size]
+        return char
+
     def get_key() -> str:
         """Read a keypress."""
-        key = stdin.read(1)
+        key = _read_char()
         if key == "\x1b":
-            char = stdin.read(1)
+            char = _read_char()
             key += char
             if char in {"[", "O"}:
                 while True:
-                    char = stdin.read(1)
+                    char = _read_char()
                     key += char
-                    if char.isalpha() or char == "~":
+                    if not char or char.isalpha() or char == "~":
                         # if char == "M":
                         #     key += stdin.buffer.read(3).decode(
                         #         errors="ignore",
@@ -64,6 +145,10 @@ else:
                         break
         return key
 
+    def key_ready(timeout: float = 0.0) -> bool:
+        """Check whether a keypress is available within a timeout."""
+        return bool(_pending) or bool(select([stdin], [], [], timeout)[0])
+
 
 class Screen:
     """Alternative screen buffer."""
@@ -71,15 +156,28 @@ class Screen:
     @classmethod
     def _print(cls, text: str) -> None:
         """Print text."""
-        print(text, end="", flush=True)
+        out = stdout.buffer
+        out.write(text.encode())
+        out.flush()
 
     def __init__(self) -> None:
         self._cols = 0
         self._rows = 0
-        self._buffer: "list[str]" = []
+        self._buffer = array(CHAR_TYPECODE)
+        self._blank = array(CHAR_TYPECODE)
+        self._prefixes: "dict[int, str]" = {}
+        self._suffixes: "dict[int, str]" = {}
+        self._lines: "list[str]" = []
+        self._row_escapes: "list[str]" = []
+        self._sgr_escapes: "dict[str, str]" = {}
         self._objects: "list[Displayable]" = []
         self._buttons: "list[Button]" = []
+        self._centers = None
         self._focus: "Button|None" = None
+        self._dirty = False
+        self._selector = DefaultSelector()
+        if platform != "win32":
+            self._selector.register(stdin, EVENT_READ)
 
         def resize_handler(signum: int, frame: "FrameType|None") -> None:
             size = get_terminal_size()
@@ -87,7 +185,10 @@ class Screen:
             rows = size.lines
             self._cols = cols
             self._rows = rows
-            self._buffer = [" "] * (cols * rows)
+            self._blank = array(CHAR_TYPECODE, " " * (cols * rows))
+            self._buffer = array(CHAR_TYPECODE, self._blank)
+            self._lines = []
+            self._row_escapes = [f"\x1b[{row}H" for row in range(1, rows + 1)]
             self.display()
 
         self._stdin_attrs = get_stdin_attrs()
@@ -124,20 +225,65 @@ class Screen:
         idx = self._idx(key[0], key[1])
         if idx >= 0:
             self._buffer[idx] = value[0]
+            self._unfmt(idx, idx + 1)
+
+    def _unfmt(self, start: int, stop: int, step: int = 1) -> None:
+        """Drop the graphic renditions of overwritten buffer cells."""
+        for marks in (self._prefixes, self._suffixes):
+            if marks:
+                for idx in [
+                    idx
+                    for idx in marks
+                    if start <= idx < stop and (idx - start) % step == 0
+                ]:
+                    del marks[idx]
+
+    def hline(self, row: int, col: int, char: str, n: int) -> None:
+        """Draw a horizontal line of `n` characters from (row, column)."""
+        self.blit(row, col, char[0] * n)
+
+    def vline(self, row: int, col: int, char: str, n: int) -> None:
+        """Draw a vertical line of `n` characters from (row, column)."""
+        cols = self._cols
+        if 1 <= col <= cols:
+            start = max(1, row)
+            stop = min(self._rows + 1, row + n)
+            if start < stop:
+                first = (start - 1) * cols + col - 1
+                last = (stop - 1) * cols
+                self._buffer[first:last:cols] = array(
+                    CHAR_TYPECODE, char[0] * (stop - start)
+                )
+                self._unfmt(first, last, cols)
+
+    def blit(self, row: int, col: int, text: str) -> None:
+        """Draw a text from (row, column) clipped to the screen."""
+        cols = self._cols
+        if 1 <= row <= self._rows:
+            start = max(1, col)
+            stop = min(cols + 1, col + len(text))
+            if start < stop:
+                base = (row - 1) * cols - 1
+                self._buffer[base + start : base + stop] = array(
+                    CHAR_TYPECODE, text[start - col : stop - col]
+                )
+                self._unfmt(base + start, base + stop)
 
     def add(self, obj: "Displayable") -> None:
         """Add a displayable object."""
         self._objects.append(obj)
         if isinstance(obj, Button):
             self._buttons.append(obj)
-        self.display()
+            self._centers = None
+        self._dirty = True
 
     def remove(self, obj: "Displayable") -> None:
         """Remove a displayable object."""
         self._objects.remove(obj)
         if isinstance(obj, Button):
             self._buttons.remove(obj)
-        self.display()
+            self._centers = None
+        self._dirty = True
 
     def fmt(self, fmt: str, row: int, col: int, width: int) -> None:
         """Select graphic rendition for a part of the buffer."""
@@ -146,38 +292,176 @@ class Screen:
             col = min(max(1, col), cols)
             width = min(max(1, width), cols - col + 1)
             idx = self._idx(row, col)
-            self._buffer[idx] = f"\x1b[{fmt}m" + self._buffer[idx]
+            sgr = self._sgr_escapes.get(fmt)
+            if sgr is None:
+                sgr = f"\x1b[{fmt}m"
+                self._sgr_escapes[fmt] = sgr
+            prefixes = self._prefixes
+            prefixes[idx] = sgr + prefixes.get(idx, "")
             idx += width - 1
-            self._buffer[idx] = self._buffer[idx] + "\x1b[m"
+            suffixes = self._suffixes
+            suffixes[idx] = suffixes.get(idx, "") + "\x1b[m"
 
     def clear(self) -> None:
         """Clear the buffer."""
-        buffer = self._buffer
-        for i in range(len(buffer)):
-            buffer[i] = " "
+        self._buffer[:] = self._blank
+        self._prefixes.clear()
+        self._suffixes.clear()
+
+    def _render(self) -> "list[str]":
+        """Render the rows of the buffer with their graphic renditions."""
+        text = self._buffer.tounicode()
+        cols = self._cols
+        lines = [text[i * cols : (i + 1) * cols] for i in range(self._rows)]
+        prefixes = self._prefixes
+        suffixes = self._suffixes
+        for idx in sorted(prefixes.keys() | suffixes.keys(), reverse=True):
+            row, col = divmod(idx, cols)
+            line = lines[row]
+            lines[row] = (
+                line[:col]
+                + prefixes.get(idx, "")
+                + line[col]
+                + suffixes.get(idx, "")
+                + line[col + 1 :]
+            )
+        return lines
 
     def display(self) -> None:
         """Display the buffer."""
+        self._dirty = False
         self.clear()
         for obj in self._objects:
             obj.display()
         if self._focus is not None:
             self._focus.focus()
-        self._print("\x1b[H" + "".join(self._buffer))
+        lines = self._render()
+        prev = self._lines
+        n_prev = len(prev)
+        changes = [
+            escape + line
+            for row, (escape, line) in enumerate(zip(self._row_escapes, lines))
+            if row >= n_prev or line != prev[row]
+        ]
+        self._lines = lines
+        if changes:
+            self._print("".join(changes))
+
+    def flush(self) -> None:
+        """Display the buffer if it is outdated."""
+        if self._dirty:
+            self.display()
+
+    def add_reader(self, fileobj: Any, callback: "Callable[[], bool]") -> None:
+        """Call back when a file object is readable until it is closed."""
+        self._selector.register(fileobj, EVENT_READ, callback)
+
+    def remove_reader(self, fileobj: Any) -> None:
+        """Stop calling back for a file object."""
+        self._selector.unregister(fileobj)
+
+    def _poll(self, timeout: "float|None") -> bool:
+        """Serve readers and report if a keypress is available in time."""
+        if key_ready():
+            return True
+        selector = self._selector
+        if platform != "win32":
+            events = selector.select(timeout)
+        else:
+            # the console cannot be selected on Windows, so it is polled
+            events = []
+            while True:
+                step = (
+                    KEY_POLL_INTERVAL
+                    if timeout is None
+                    else min(timeout, KEY_POLL_INTERVAL)
+                )
+                has_readers = bool(selector.get_map())
+                if key_ready(0.0 if has_readers else step):
+                    return True
+                if has_readers:
+                    events = selector.select(step)
+                    if events:
+                        break
+                if timeout is not None:
+                    timeout -= step
+                    if timeout <= 0.0:
+                        break
+        ready = False
+        for key, _ in events:
+            callback = key.data
+            if callback is None:
+                ready = True
+            elif key.fileobj in selector.get_map():
+                # a failing reader is dropped instead of ending the input loop
+                try:
+                    is_open = callback()
+                except Exception:
+                    is_open = False
+                if not is_open:
+                    selector.unregister(key.fileobj)
+        return ready
+
+    def _closest_button(self, col_factor: int, row_factor: int) -> int:
+        """Get the index of the button closest to the focus in a direction."""
+        buttons = self._buttons
+        focus = self._focus
+        row, col = focus.center
+        np = (
+            _import_numpy() if len(buttons) >= MIN_VECTORIZED_BUTTONS else None
+        )
+        if np is not None:
+            centers = self._centers
+            if centers is None:
+                centers = np.array(
+                    [button.center for button in buttons], dtype=float
+                )
+                self._centers = centers
+            col_diff = centers[:, 1] - col
+            row_diff = 2.0 * (centers[:, 0] - row)
+            weights = (col_factor * col_diff + row_factor * row_diff) / (
+                col_diff * col_diff + row_diff * row_diff + 1.0
+            )
+            if focus in buttons:
+                weights[buttons.index(focus)] = -np.inf
+            choice = int(weights.argmax())
+            return choice if weights[choice] > 0.0 else -1
+        best_weight = 0.0
+        choice = -1
+        for i, button in enumerate(buttons):
+            if button != focus:
+                center = button.center
+                col_diff = center[1] - col
+                row_diff = 2 * (center[0] - row)
+                weight = (col_factor * col_diff + row_factor * row_diff) / (
+                    col_diff * col_diff + row_diff * row_diff + 1
+                )
+                if weight > best_weight:
+                    best_weight = weight
+                    choice = i
+        return choice
 
     def listen_keys(self) -> None:
         """Listen for input."""
         buttons = self._buttons
+        burst = 0
+        avg_burst = 0.0
         while True:
+            if self._dirty:
+                # coalesce bursts of input (e.g. pastes) into a single redraw
+                wait = min(MAX_POLL_WAIT, POLL_WAIT_STEP * (avg_burst - 1.0))
+                if not self._poll(max(0.0, wait)):
+                    self.display()
+                    avg_burst += BURST_SMOOTHING * (burst - avg_burst)
+                    burst = 0
+                    continue
+            elif not self._poll(None):
+                continue
             key = get_key()
             if key == "\x1b\x1b":
                 break
             if key in {"\x1b[A", "\x1b[B", "\x1b[C", "\x1b[D"}:
                 if self._focus is not None:
-                    focus = self._focus
-                    center = focus.center
-                    col = center[1]
-                    row = center[0]
                     if key == "\x1b[A":
                         col_factor = 0
                         row_factor = -1
@@ -190,24 +474,13 @@ class Screen:
                     elif key == "\x1b[D":
                         col_factor = -1
                         row_factor = 0
-                    best_weight = 0.0
-                    choice = -1
-                    for i, button in enumerate(buttons):
-                        if button != focus:
-                            center = button.center
-                            col_diff = center[1] - col
-                            row_diff = 2 * (center[0] - row)
-                            weight = (
-                                col_factor * col_diff + row_factor * row_diff
-                            ) / (col_diff * col_diff + row_diff * row_diff + 1)
-                            if weight > best_weight:
-                                best_weight = weight
-                                choice = i
+                    choice = self._closest_button(col_factor, row_factor)
                     if choice >= 0:
                         self._focus = buttons[choice]
                 elif len(buttons) > 0:
                     self._focus = buttons[0]
-                self.display()
+                self._dirty = True
+                burst += 1
             elif key == "\r" and self._focus is not None:
                 self._focus.press()
 
@@ -215,6 +488,7 @@ class Screen:
         """Close the buffer."""
         self._print("\x1b[?1049l\x1b[?25h\x1b[?1003l\x1b[?1006l")
         set_stdin_attrs(self._stdin_attrs)
+        self._selector.close()
 
 
 class Point:
@@ -224,13 +498,13 @@ class Point:
         self.x = x
         self.y = y
 
-    def col(self, cols) -> int:
+    def col(self, cols: int) -> int:
         """Get the column index."""
-        return self.x * (cols - 1) + 1
+        return round(self.x * (cols - 1)) + 1
 
-    def row(self, rows) -> int:
+    def row(self, rows: int) -> int:
         """Get the row index."""
-        return self.y * (rows - 1) + 1
+        return round(self.y * (rows - 1)) + 1
 
 
 class Displayable(ABC):
@@ -267,8 +541,7 @@ class Text(Displayable):
         col = self.col
         row = self.row
         text = self._text
-        for i, char in enumerate(text):
-            screen[row, col + i] = char
+        screen.blit(row, col, text)
         fmt = self._fmt
         if fmt:
             screen.fmt(fmt, row, col, len(text))
@@ -277,6 +550,33 @@ class Text(Displayable):
 class Button(Text):
     """Button."""
 
+    @property
+    def row(self) -> int:
+        """Row index."""
+        return self._row
+
+    @row.setter
+    def row(self, row: int) -> None:
+        self._row = row
+        self._moved()
+
+    @property
+    def col(self) -> int:
+        """Column index."""
+        return self._col
+
+    @col.setter
+    def col(self, col: int) -> None:
+        self._col = col
+        self._moved()
+
+    def _moved(self) -> None:
+        """Invalidate the button centers cached by the screen."""
+        # the position is first set before the button is added to a screen
+        screen = getattr(self, "_screen", None)
+        if screen is not None:
+            screen._centers = None
+
     @property
     def center(self) -> "tuple[int, int]":
         """Get the position of the center."""
@@ -298,26 +598,57 @@ class Rectangle(Displayable):
     ) -> None:
         self.top_left = top_left
         self.bottom_right = bottom_right
+        self._sprite_key: "tuple[int, int, float, float, float, float]|None"
+        self._sprite_key = None
+        self._sprite_rows: "list[tuple[int, int, str]]" = []
+        self._sprite_cols: "list[tuple[int, int, int]]" = []
         super().__init__(screen)
 
-    def display(self) -> None:
-        screen = self._screen
-        cols = screen.cols
-        rows = screen.rows
+    def _render(self, cols: int, rows: int) -> None:
+        """Render the horizontal and vertical edges for a screen size."""
         top_left = self.top_left
         x = top_left.col(cols)
         y = top_left.row(rows)
         bottom_right = self.bottom_right
         w = bottom_right.col(cols) - x + 1
         h = bottom_right.row(rows) - y + 1
-        screen[y, x] = "╔"
-        for i in range(1, w - 1):
-            screen[y, x + i] = "═"
-        screen[y, x + w - 1] = "╗"
-        for j in range(1, h - 1):
-            screen[y + j, x] = "║"
-            screen[y + j, x + w - 1] = "║"
-        screen[y + h - 1, x] = "╚"
-        for i in range(1, w - 1):
-            screen[y + h - 1, x + i] = "═"
-        screen[y + h - 1, x + w - 1] = "╝"
+        sprite_rows = []
+        sprite_cols = []
+        if w >= 1 and h >= 1:
+            if h > 1:
+                sprite_rows.append(
+                    (y, x, ("╔" + "═" * (w - 2))[: w - 1] + "╗")
+                )
+            sprite_rows.append(
+                (y + h - 1, x, ("╚" + "═" * (w - 2))[: w - 1] + "╝")
+            )
+            if h > 2:
+                sprite_cols.append((y + 1, x, h - 2))
+                if w > 1:
+                    sprite_cols.append((y + 1, x + w - 1, h - 2))
+        self._sprite_rows = sprite_rows
+        self._sprite_cols = sprite_cols
+
+    def display(self) -> None:
+        screen = self._screen
+        cols = screen.cols
+        rows = screen.rows
+        top_left = self.top_left
+        bottom_right = self.bottom_right
+        key = (
+            cols,
+            rows,
+            top_left.x,
+            top_left.y,
+            bottom_right.x,
+            bottom_right.y,
+        )
+        if key != self._sprite_key:
+            self._render(cols, rows)
+            self._sprite_key = key
+        blit = screen.blit
+        for row, col, text in self._sprite_rows:
+            blit(row, col, text)
+        vline = screen.vline
+        for row, col, n in self._sprite_cols:
+            vline(row, col, "║", n)